@@ -15,10 +15,33 @@ from .world import *
 from .utils import *
 from .parser import *
 import pkg_resources
+import functools
+import math
 import pygame
 import numpy
 
 
+@functools.lru_cache(maxsize=None)
+def make_scale_func(cs: int):
+    """Creates a function that scales a 3D RGB array up by a fixed cell size.
+
+    The cell size is baked into the returned function, so every frame only
+    does a single broadcasted copy into a (W, cs, H, cs, 3) buffer instead of
+    two chained numpy.repeat calls with a variable repeat count.
+
+    :param int cs: Size of a cell in pixel.
+    :return: Function taking a (W, H, 3) array and returning a (W * cs, H * cs, 3) array.
+    :rtype: function
+    """
+    def scale(colors):
+        width, height = colors.shape[0], colors.shape[1]
+        scaled = numpy.empty((width, cs, height, cs, 3), dtype=colors.dtype)
+        scaled[...] = colors[:, numpy.newaxis, :, numpy.newaxis, :]
+        return scaled.reshape(width * cs, height * cs, 3)
+
+    return scale
+
+
 class Game:
     """Game
     ====
@@ -38,21 +61,32 @@ class Game:
     """
 
     def __init__(self, rw: int, rh: int, gw: int, gh: int, cs: int, ti: int, se: int, ca: tuple, cd: tuple, cf: tuple, cb: tuple, fr: float, fd: float, ps: bool, po: bool, to: bool, fa: bool):
-        self.cell_size = cs
+        self.change_scale_func(cs)
         self.tickrate = ti
         self.color_alive = numpy.array(ca)
         self.color_dead = numpy.array(cd)
         self.color_fade = numpy.array(cf)
         self.color_background = numpy.array(cb)
+        self.color_diff = self.color_alive - self.color_fade
         self.pause_stalemate = ps
         self.pause_oscillators = po
         self.toroid = to
         self.fade = fa
 
+        # Without fading the grid only holds 0s and 1s, and fading cells are drawn in the alive color
+        # if it equals the fade color, so in both cases the interpolation can be skipped
+        self.palette = numpy.array([self.color_dead, self.color_alive]).clip(0, 255)
+        if not self.fade or numpy.array_equal(self.color_fade, self.color_alive):
+            self.colorize = self.colorize_binary
+        else:
+            self.colorize = self.colorize_fade
+
         self.setup_pygame(rw, rh)
 
         self.create_world(gw, gh, se, fr, fd)
 
+        self.setup_handlers()
+
     def create_world(self, gw: int, gh: int, se: int, fr, fd) -> None:
         """Creates a new World Object.
 
@@ -74,6 +108,14 @@ class Game:
         # Create the pygame surface in the correct size
         self.get_borders()
 
+    def change_scale_func(self, cs: int) -> None:
+        """Sets the cell size and picks the scale function specialized for it.
+
+        :param int cs: Size of a cell in pixel.
+        """
+        self.cell_size = int(cs)
+        self.scale = make_scale_func(self.cell_size)
+
     def setup_pygame(self, rw, rh) -> None:
         """Creates and configures pygame instance.
         """
@@ -82,6 +124,7 @@ class Game:
         icon = pygame.image.load(pkg_resources.resource_filename("cgol", "icon.png"))
         pygame.display.set_icon(icon)
         self.dis = pygame.display.set_mode((rw, rh), pygame.RESIZABLE, 8,)
+        self.sur = None
         self.clock = pygame.time.Clock()
 
     def get_borders(self) -> None:
@@ -95,10 +138,11 @@ class Game:
             - vis_width: The width of the visible region, in pixels.
             - vis_height: The height of the visible region, in pixels.
         """
-        self.vis_north = max(0, int((-self.offset_y) / self.cell_size))
-        self.vis_south = max(0, min(self.world.grid_height, self.world.grid_height - int(self.offset_y / self.cell_size) - self.world.grid_height - int(-self.dis.get_size()[1] / self.cell_size) + 1))
-        self.vis_west = max(0, int((-self.offset_x) / self.cell_size))
-        self.vis_east = max(0, min(self.world.grid_width, self.world.grid_width - int(self.offset_x / self.cell_size) - self.world.grid_width - int(-self.dis.get_size()[0] / self.cell_size) + 1))
+        res_width, res_height = self.dis.get_size()
+        self.vis_north = max(0, int(-self.offset_y / self.cell_size))
+        self.vis_south = max(0, min(self.world.grid_height, res_height // self.cell_size - int(self.offset_y / self.cell_size) + 1))
+        self.vis_west = max(0, int(-self.offset_x / self.cell_size))
+        self.vis_east = max(0, min(self.world.grid_width, res_width // self.cell_size - int(self.offset_x / self.cell_size) + 1))
         self.vis_width = (self.vis_east - self.vis_west) * self.cell_size
         self.vis_height = (self.vis_south - self.vis_north) * self.cell_size
 
@@ -119,7 +163,7 @@ class Game:
         Color dead:  [  0,   0, 0]
         Color fade:  [  0,   0, 0]
 
-        This 3D Array gets scaled up using numpy be the cell size like so:
+        This 3D Array gets scaled up by the cell size like so:
 
         Before:
         [[[127  72   0]  [255 144   0]]
@@ -138,27 +182,16 @@ class Game:
         self.dis.fill(self.color_background)
 
         # Get the slice of self.world.grid that is actually visible and has to be rendered
-        colors = self.world.grid[self.vis_west:self.vis_east, self.vis_north:self.vis_south][:, :, numpy.newaxis]
-
-        # Create color arrays in the shape of the clipped self.world.grid so they can be broadcasted together
-        color_dead_arr = numpy.full((colors.shape[0], colors.shape[1], 3), self.color_dead)
-        color_alive_arr = numpy.full((colors.shape[0], colors.shape[1], 3), self.color_alive)
-
-        # Set static colors
-        colors = numpy.where(colors == 0, color_dead_arr, colors)
-        colors = numpy.where(colors == 1, color_alive_arr, colors)
-
-        # Set fading colors using interpolation
-        colors = numpy.where((colors > 0) & (colors < 1), (self.color_fade + (self.color_alive - self.color_fade) * colors), colors)
-
-        # Clip final array
-        colors = colors.clip(0, 255).astype(int)
+        colors = self.colorize(self.world.grid[self.vis_west:self.vis_east, self.vis_north:self.vis_south])
 
         # Scale the array in both axis
-        colors = numpy.repeat(numpy.repeat(colors, self.cell_size, axis=1), self.cell_size, axis=0)
+        colors = self.scale(colors)
 
-        # Create a surface from the array
-        self.sur = pygame.surfarray.make_surface(colors)
+        # Reuse the surface as long as the visible region keeps its size, otherwise create a new one from the array
+        if self.sur is not None and self.sur.get_size() == colors.shape[:2]:
+            pygame.surfarray.blit_array(self.sur, colors)
+        else:
+            self.sur = pygame.surfarray.make_surface(colors)
 
         # If the left or top border is not visible, the offset needs to be adjusted
         if self.vis_west > 0:
@@ -175,6 +208,34 @@ class Game:
         # Update display
         pygame.display.flip()
 
+    def colorize_fade(self, grid) -> numpy.array:
+        """Maps the cell values to RGB values, interpolating the colors of fading cells.
+
+        :param numpy.array grid: The visible slice of the grid.
+        :return: The RGB values for each cell.
+        :rtype: numpy.array int
+        """
+        colors = grid[:, :, numpy.newaxis]
+
+        # Set fading colors using interpolation, alive cells end up with the alive color
+        colors = self.color_fade + self.color_diff * colors
+
+        # Set static colors, the color is broadcasted against the cells
+        colors = numpy.where(grid[:, :, numpy.newaxis] == 0, self.color_dead, colors)
+
+        # Clip final array
+        return colors.clip(0, 255).astype(int)
+
+    def colorize_binary(self, grid) -> numpy.array:
+        """Maps the cell values to RGB values without interpolation.
+        Every cell that is not dead is drawn in the alive color.
+
+        :param numpy.array grid: The visible slice of the grid.
+        :return: The RGB values for each cell.
+        :rtype: numpy.array int
+        """
+        return self.palette[(grid > 0).view(numpy.uint8)]
+
     def center(self) -> None:
         """Updates offsets so that pygame.surface is centered.
         """
@@ -196,12 +257,12 @@ class Game:
         # Catch if the World stopped developing because of a stalemate
         if self.pause_stalemate and self.world.check_stalemate():
             print("\nGame stopped. Reason: Stalemate.")
-            self.game_loop(pause=True)
+            self.running = False
 
         # Catch if the World stopped developing because only oscillators remain
         if self.pause_oscillators and self.world.check_oscillators():
             print("\nGame stopped. Reason: Only Oscillators remaining.")
-            self.game_loop(pause=True)
+            self.running = False
 
     def interpolate(self, point0, point1) -> tuple or int:
         """Interpolates between two points.
@@ -210,7 +271,7 @@ class Game:
         :rtype: tuple or int
         """
         # Calculate distance between previous and current position
-        distance = numpy.linalg.norm(numpy.array(point1) - numpy.array(point0))
+        distance = math.hypot(point1[0] - point0[0], point1[1] - point0[1])
 
         # Prevent division by zero
         if distance >= 2:
@@ -229,172 +290,289 @@ class Game:
 
             return int(x), int(y)
 
+    def setup_handlers(self) -> None:
+        """Creates the dictionaries mapping pygame events to their handlers.
+        """
+        self.event_handlers = {
+            pygame.QUIT: self.on_quit,
+            pygame.VIDEORESIZE: self.on_resize,
+            pygame.KEYDOWN: self.on_key_down,
+            pygame.MOUSEBUTTONDOWN: self.on_mouse_down,
+            pygame.MOUSEBUTTONUP: self.on_mouse_up,
+            pygame.MOUSEWHEEL: self.on_mouse_wheel,
+        }
+        self.key_handlers = {
+            # RETURN pressed: Pause game
+            pygame.K_RETURN: self.toggle_running,
+            # ESCAPE pressed: Close game
+            pygame.K_ESCAPE: self.on_quit,
+            # Right Arrow pressed: Forward one generation
+            pygame.K_RIGHT: self.calc_generation,
+            # I pressed: Insert Mode
+            pygame.K_i: self.toggle_insert_mode,
+            # R pressed: Reset game
+            pygame.K_r: self.reset,
+            # F pressed: Fill with random cells
+            pygame.K_f: self.fill_random,
+            # A pressed: Fill with alive cells
+            pygame.K_a: self.fill_alive,
+            # D pressed: Fill with dead cells
+            pygame.K_d: self.fill_dead,
+            # K pressed: Kill alive cells
+            pygame.K_k: self.kill,
+            # L pressed: Load last saved game
+            pygame.K_l: self.load,
+            # S pressed: Save current game
+            pygame.K_s: self.save,
+            # C pressed: Center view
+            pygame.K_c: self.center_view,
+            # P pressed: Save screenshot
+            pygame.K_p: self.screenshot,
+            # + pressed: Extend grid
+            pygame.K_PLUS: self.extend,
+            # - pressed: Reduce grid
+            pygame.K_MINUS: self.reduce,
+            # 1, 2 or 3 pressed in Insert Mode: Load pattern
+            pygame.K_1: functools.partial(self.load_pattern, "1.rle"),
+            pygame.K_2: functools.partial(self.load_pattern, "2.rle"),
+            pygame.K_3: functools.partial(self.load_pattern, "3.rle"),
+        }
+        self.mouse_down_handlers = {
+            # Left click: Draw alive cells
+            1: functools.partial(self.start_drawing, 1),
+            # Middle click: Drag the view
+            2: self.start_drag,
+            # Right click: Erase cells
+            3: functools.partial(self.start_drawing, 0),
+        }
+        self.insert_mouse_down_handlers = {
+            # Left click in Insert Mode: Place pattern
+            1: self.insert_pattern,
+        }
+        self.mouse_up_handlers = {
+            1: self.stop_drawing,
+            2: self.stop_drag,
+            3: self.stop_drawing,
+        }
+
+    def on_quit(self, event=None) -> None:
+        """Closes the game.
+        """
+        shutdown(pygame)
+
+    def on_resize(self, event) -> None:
+        """Updates the visible region after the window was resized.
+        """
+        self.get_borders()
+
+    def on_key_down(self, event) -> None:
+        """Calls the handler of the pressed key.
+        """
+        handler = self.key_handlers.get(event.key)
+        if handler is not None:
+            handler()
+
+    def on_mouse_down(self, event) -> None:
+        """Calls the handler of the pressed mouse button, Insert Mode has its own handlers.
+        """
+        handlers = self.insert_mouse_down_handlers if self.insert_mode else self.mouse_down_handlers
+        handler = handlers.get(event.button)
+        if handler is not None:
+            handler()
+
+    def on_mouse_up(self, event) -> None:
+        """Calls the handler of the released mouse button.
+        """
+        handler = self.mouse_up_handlers.get(event.button)
+        if handler is not None:
+            handler()
+
+    def on_mouse_wheel(self, event) -> None:
+        """Rotates the pattern in Insert Mode, zooms otherwise.
+        """
+        # Insert Mode: Rotate pattern
+        if self.insert_mode:
+            if event.y == 1:
+                self.rotation += 1
+            elif event.y == -1:
+                self.rotation -= 1
+        # Zoom
+        else:
+            if event.y == 1:
+                self.change_scale_func(self.cell_size * 2)
+                self.offset_x = self.curr_pos[0] + (self.offset_x - self.curr_pos[0]) * 2
+                self.offset_y = self.curr_pos[1] + (self.offset_y - self.curr_pos[1]) * 2
+                self.get_borders()
+            elif event.y == -1 and self.cell_size > 1:
+                self.change_scale_func(self.cell_size // 2)
+                self.offset_x = self.curr_pos[0] + (self.offset_x - self.curr_pos[0]) / 2
+                self.offset_y = self.curr_pos[1] + (self.offset_y - self.curr_pos[1]) / 2
+                self.get_borders()
+
+    def toggle_running(self) -> None:
+        """Pauses or resumes the game.
+        """
+        self.running = not self.running
+
+    def toggle_insert_mode(self) -> None:
+        """Switches Insert Mode on or off.
+        """
+        self.insert_mode = not self.insert_mode
+
+    def reset(self) -> None:
+        """Resets the grid to the cells of the seed.
+        """
+        self.world.populate("seed")
+
+    def fill_random(self) -> None:
+        """Fills the grid with random cells.
+        """
+        self.world.populate("random")
+
+    def fill_alive(self) -> None:
+        """Fills the grid with alive cells.
+        """
+        self.world.populate("alive")
+
+    def fill_dead(self) -> None:
+        """Fills the grid with dead cells.
+        """
+        self.world.populate("dead")
+
+    def kill(self) -> None:
+        """Kills all alive cells.
+        """
+        self.world.populate("kill")
+
+    def load(self) -> None:
+        """Loads the last saved game.
+        """
+        grid = CSV.load(get_save_path("/cgol/exports/") + "save.csv")
+        if grid is not None:
+            self.world.load_list(grid)
+            self.get_borders()
+
+    def save(self) -> None:
+        """Saves the current game.
+        """
+        CSV.save((self.world.grid >= 1).astype(numpy.uint8), get_save_path("/cgol/exports/") + "save.csv")
+
+    def center_view(self) -> None:
+        """Centers the grid in the window.
+        """
+        self.center()
+        self.get_borders()
+
+    def screenshot(self) -> None:
+        """Saves a screenshot of the grid.
+        """
+        pygame.image.save(self.sur, f"{get_save_path('/cgol/images/') + str(self.world.seed) + str(self.world.generations)}.png")
+
+    def extend(self) -> None:
+        """Extends the grid by one cell on every side.
+        """
+        self.world.extend()
+        self.get_borders()
+
+    def reduce(self) -> None:
+        """Reduces the grid by one cell on every side.
+        """
+        self.world.reduce()
+        self.get_borders()
+
+    def load_pattern(self, file_name: str) -> None:
+        """Loads a pattern to be placed in Insert Mode.
+
+        :param str file_name: Name of the RLE file in the patterns folder.
+        """
+        if self.insert_mode:
+            self.pattern = RLE.load(get_save_path("/cgol/patterns/") + file_name)
+
+    def insert_pattern(self) -> None:
+        """Places the loaded pattern at the mouse position.
+        """
+        if self.pattern is not None:
+            self.world.insert_pattern(self.pattern.decoded, self.curr_pos_cell, self.rotation)
+        else:
+            print("Couldn't insert pattern.")
+
+    def start_drawing(self, draw_color: int) -> None:
+        """Starts drawing cells with the mouse.
+
+        :param int draw_color: 1 to birth cells, 0 to kill them.
+        """
+        self.oldoffset_x, self.oldoffset_y = self.offset_x, self.offset_y
+        self.prev_pos = self.curr_pos
+        self.draw_color = draw_color
+        self.drawing = True
+
+    def stop_drawing(self) -> None:
+        """Stops drawing cells with the mouse.
+        """
+        self.prev_pos = None
+        self.drawing = False
+
+    def start_drag(self) -> None:
+        """Starts dragging the view with the mouse.
+        """
+        self.oldoffset_x, self.oldoffset_y = self.offset_x, self.offset_y
+        self.prev_pos = self.curr_pos
+        self.dragging = True
+
+    def stop_drag(self) -> None:
+        """Stops dragging the view with the mouse.
+        """
+        self.prev_pos = None
+        self.dragging = False
+
     def run(self, pause=False) -> None:
         """The main loop that runs the game.
         """
         # Flags
-        running = not pause
-        draw = False
-        drag = False
-        prev_pos = None
-        insert_mode = False
-        rotation = 0
+        self.running = not pause
+        self.drawing = False
+        self.dragging = False
+        self.prev_pos = None
+        self.insert_mode = False
+        self.rotation = 0
+        self.pattern = None
 
         while True:
             self.clock.tick(self.tickrate)
 
             # Save mouse position
-            curr_pos = pygame.mouse.get_pos()
-            curr_pos_cell = int((curr_pos[0]-self.offset_x)//self.cell_size), int((curr_pos[1]-self.offset_y)//self.cell_size)
+            self.curr_pos = pygame.mouse.get_pos()
+            self.curr_pos_cell = int((self.curr_pos[0]-self.offset_x)//self.cell_size), int((self.curr_pos[1]-self.offset_y)//self.cell_size)
 
             # Screen drag
-            if drag and prev_pos != None:
-                self.offset_x, self.offset_y = numpy.add(numpy.subtract(curr_pos, prev_pos), (oldoffset_x, oldoffset_y))
+            if self.dragging and self.prev_pos != None:
+                self.offset_x = self.oldoffset_x + self.curr_pos[0] - self.prev_pos[0]
+                self.offset_y = self.oldoffset_y + self.curr_pos[1] - self.prev_pos[1]
                 self.get_borders()
 
             # Event loop
             for event in pygame.event.get():
-                # Game shutdown
-                if event.type == pygame.QUIT:
-                    shutdown(pygame)
-                # Display resized
-                elif event.type == pygame.VIDEORESIZE:
-                    self.get_borders()
-                # Key events
-                elif event.type == pygame.KEYDOWN:
-                    # RETURN pressed: Pause game
-                    if event.key == pygame.K_RETURN:
-                        running = not running
-                    # ESCAPE pressed: Close game
-                    if event.key == pygame.K_ESCAPE:
-                        shutdown(pygame)
-                    # Right Arrow pressed: Forward one generation
-                    if event.key == pygame.K_RIGHT:
-                        self.calc_generation()
-                    # I pressed: Insert Mode
-                    if event.key == pygame.K_i:
-                        insert_mode = not insert_mode
-                    # R pressed: Reset game
-                    if event.key == pygame.K_r:
-                        self.world.populate("seed")
-                    # F pressed: Fill with random cells
-                    if event.key == pygame.K_f:
-                        self.world.populate("random")
-                    # A pressed: Fill with alive cells
-                    if event.key == pygame.K_a:
-                        self.world.populate("alive")
-                    # D pressed: Fill with dead cells
-                    if event.key == pygame.K_d:
-                        self.world.populate("dead")
-                    # K pressed: Kill alive cells
-                    if event.key == pygame.K_k:
-                        self.world.populate("kill")
-                    # L pressed: Load last saved game
-                    if event.key == pygame.K_l:
-                        grid = CSV.decode(load_import(get_save_path("/cgol/exports/") + "save.csv"))
-                        if grid is not None:
-                            self.world.load_list(grid)
-                            self.get_borders()
-                    # S pressed: Save current game
-                    if event.key == pygame.K_s:
-                        grid = CSV.encode((numpy.where(self.world.grid < 1, 0, 1)))
-                        if grid is not None:
-                            save_export(grid, get_save_path("/cgol/exports/") + "save.csv")
-                    # C pressed: Center view
-                    if event.key == pygame.K_c:
-                        self.center()
-                        self.get_borders()
-                    # P pressed: Save screenshot
-                    if event.key == pygame.K_p:
-                        pygame.image.save(self.sur, f"{get_save_path('/cgol/images/') + str(self.world.seed) + str(self.world.generations)}.png")
-                    # + pressed: Extend grid
-                    if event.key == pygame.K_PLUS:
-                        self.world.extend()
-                        self.get_borders()
-                    # - pressed: Reduce grid
-                    if event.key == pygame.K_MINUS:
-                        self.world.reduce()
-                        self.get_borders()
-                    if event.key == pygame.K_1 and insert_mode:
-                        self.pattern = RLE.decode(load_import(get_save_path("/cgol/patterns/") + "1.rle"))
-                    if event.key == pygame.K_2 and insert_mode:
-                        self.pattern = RLE.decode(load_import(get_save_path("/cgol/patterns/") + "2.rle"))
-                    if event.key == pygame.K_3 and insert_mode:
-                        self.pattern = RLE.decode(load_import(get_save_path("/cgol/patterns/") + "3.rle"))
-
-                # Mouse events
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if insert_mode:
-                        if event.button == 1:
-                            try:
-                                if self.pattern is not None:
-                                    self.world.insert_pattern(numpy.array(self.pattern.decoded), curr_pos_cell, rotation)
-                            except AttributeError:
-                                print("Couldn't insert pattern.")
-                  
-                    else:
-                        # Left/Right Click: Draw
-                        if event.button == 1 or event.button == 3:
-                            oldoffset_x, oldoffset_y = self.offset_x, self.offset_y
-                            prev_pos = curr_pos
-                            draw = True
-                        if event.button == 1:
-                            draw_color = 1
-                        if event.button == 3:
-                            draw_color = 0
-                        # Middle Mouse: Drag screen
-                        if event.button == 2:
-                            oldoffset_x, oldoffset_y = self.offset_x, self.offset_y
-                            prev_pos = curr_pos
-                            drag = True
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    # Left/Right Click: Draw
-                    if event.button == 1 or event.button == 3:
-                        prev_pos = None
-                        draw = False
-                    # Middle Mouse: Drag screen
-                    if event.button == 2:
-                        prev_pos = None
-                        drag = False
-
-                # Zoom
-                elif event.type == pygame.MOUSEWHEEL:
-                    if insert_mode:
-                        if event.y == 1:
-                            rotation += 1
-                        elif event.y == -1:
-                            rotation -= 1
-                    else:
-                        if event.y == 1:
-                            self.cell_size *= 2
-                            self.offset_x = curr_pos[0] + (self.offset_x - curr_pos[0]) * 2
-                            self.offset_y = curr_pos[1] + (self.offset_y - curr_pos[1]) * 2
-                            self.get_borders()
-                        elif event.y == -1 and self.cell_size > 1:
-                            self.cell_size /= 2
-                            self.offset_x = curr_pos[0] + (self.offset_x - curr_pos[0]) / 2
-                            self.offset_y = curr_pos[1] + (self.offset_y - curr_pos[1]) / 2
-                            self.get_borders()
+                handler = self.event_handlers.get(event.type)
+                if handler is not None:
+                    handler(event)
 
             # Interpolate to prevent dotted line
-            if draw and prev_pos != None and not insert_mode:
-                x, y = self.interpolate(prev_pos, curr_pos)
-                if isinstance(x, int) and isinstance(y, int):
-                    if 0 <= x < self.world.grid_width and 0 <= y < self.world.grid_height:
-                        self.world.grid[x, y] = draw_color or (0.5 if self.world.grid[x, y] == 1.0 and not draw_color else self.world.grid[x, y])
-                elif min(x) >= 0 and max(x) < self.world.grid_width and min(y) >= 0 and max(y) < self.world.grid_height:
-                    for xc, yc in zip(x, y):
-                        self.world.grid[xc, yc] = draw_color or (0.5 if self.world.grid[xc, yc] == 1.0 and not draw_color else self.world.grid[xc, yc])
-                prev_pos = curr_pos
+            if self.drawing and self.prev_pos != None and not self.insert_mode:
+                x, y = self.interpolate(self.prev_pos, self.curr_pos)
+
+                # Works for a single cell as well as for the arrays of interpolated cells
+                if numpy.all((0 <= x) & (x < self.world.grid_width) & (0 <= y) & (y < self.world.grid_height)):
+                    # Drawing sets the cells alive, erasing lets alive cells fade and keeps the others
+                    cells = self.world.grid[x, y]
+                    self.world.grid[x, y] = self.draw_color or numpy.where(cells == 1, 0.5, cells)
+                self.prev_pos = self.curr_pos
 
             # Draw before we start updating the cells
             self.draw()
 
             # Skip over generation to pause game
-            if not running or draw:
+            if not self.running or self.drawing:
                 continue
 
             # Calculate the next generation
             self.calc_generation()
-
-        shutdown(pygame)
@@ -1,7 +1,13 @@
 """
 COGL File Parser
 """
-import csv as csv_
+import io
+import re
+import numpy
+
+
+# Matches a run of the RLE pattern string: an optional count followed by a tag
+RLE_TOKEN = re.compile(r"(\d*)([bo$!])")
 
 
 class CSV:
@@ -18,41 +24,75 @@ class CSV:
         :return: Encoded CSV string.
         :rtype: str
         """
-        result = ""
-        try:
-            for row in array:
-                for x in row:
-                    result += str(x) + delim
-                result += "\n"
-            return result
-        except Exception as e:
-            print("Couldn't encode string.", e)
-            return None
+        return "".join(delim.join(map(str, row)) + delim + "\n" for row in array)
 
-    def decode(string: str) -> list:
+    def decode(string: str, delim=',') -> numpy.ndarray:
         """Loads the Grid from a CSV string.
 
         :param str string: The string to be decoded.
+        :param string delim: The delimiter of the CSV string.
         :return: The decoded array.
-        :rtype: array
+        :rtype: numpy.ndarray
         """
+        if string is None:
+            print("Got a NoneType string.")
+            return None
+
         try:
-            reader = csv_.reader(string.split('\n'), delimiter=',')
-            result = []
-            row = []
-
-            for row_ in reader:
-                for x in row_:
-                    if x == "1" or x == "0":
-                        row.append(int(x))
-                if len(row) != 0:
-                    result.append(row)
-                    row = []
-            return result
-        except Exception as e:
+            return CSV.read(string.splitlines(), delim)
+        except ValueError as e:
             print("Couldn't decode string.", e)
             return None
 
+    def save(array, save_file: str, delim=',') -> bool:
+        """Saves the array into a CSV file using numpy.savetxt.
+
+        The file has the same format as the string created by CSV.encode.
+
+        :param list array: The array to be saved.
+        :param str save_file: Path of the file to be saved.
+        :param string delim: The delimiter of the CSV file.
+        :return: Was the file saved?
+        :rtype: bool
+        """
+        array = numpy.asarray(array, dtype=numpy.uint8)
+        try:
+            numpy.savetxt(save_file, array, fmt="%d", delimiter=delim, newline=delim + "\n")
+            print("Successfully saved into:", save_file)
+            return True
+        except OSError as e:
+            print("Couldn't save file.", e)
+            return False
+
+    def load(save_file: str, delim=',') -> numpy.ndarray:
+        """Loads the Grid from a CSV file.
+
+        The file is streamed into the parser line by line instead of being read into a string first.
+
+        :param str save_file: Path of the file to be loaded.
+        :param string delim: The delimiter of the CSV file.
+        :return: The decoded array.
+        :rtype: numpy.ndarray
+        """
+        try:
+            with open(save_file, "r") as file:
+                return CSV.read(file, delim)
+        except (OSError, ValueError) as e:
+            print("Couldn't load file.", e)
+            return None
+
+    def read(lines, delim=',') -> numpy.ndarray:
+        """Parses CSV lines into an array using numpy.loadtxt.
+
+        :param iterable lines: The lines to be parsed.
+        :param string delim: The delimiter of the CSV lines.
+        :return: The parsed array.
+        :rtype: numpy.ndarray
+        """
+        # Rows end with a delimiter, which would otherwise be read as an empty column
+        lines = (line.rstrip().rstrip(delim) for line in lines)
+        return numpy.loadtxt(lines, delimiter=delim, dtype=numpy.uint8, ndmin=2)
+
 
 class RLE:
     """A Run Length Encoded file parser.
@@ -60,8 +100,12 @@ class RLE:
     https://conwaylife.com/wiki/Run_Length_Encoded
     """
 
+    # Header lines that hold a single value and the attribute they are stored in
+    header_fields = {"O": "author", "N": "name"}
+
     def encode(array, name: str, author: str = "", comments: str = "", rule="B3/S23"):
-        parser = RLE(len(array), len(array[0]), rule, name, author, comments)
+        height, width = numpy.shape(array)
+        parser = RLE(width, height, rule, name, author, comments)
 
         # Add the header rows
         parser.encode_header()
@@ -74,23 +118,43 @@ class RLE:
 
         return parser
 
-    def decode(text: str):
+    def decode(text):
         parser = RLE()
 
         if text is None:
             print("Got a NoneType string.")
             return None
 
-        # Parse the file line by line
-        for line in text.split("\n"):
-            parser.decode_line(line)
+        # Parse the text line by line, strings are streamed instead of split into a list of lines
+        lines = io.StringIO(text) if isinstance(text, str) else text
+        for line in lines:
+            parser.decode_line(line.rstrip("\r\n"))
+
+        # Join the collected pattern lines once
+        parser.encoded += "".join(parser.pattern_lines)
 
         # Decode the extracted pattern string
         parser.decode_pattern()
 
         return parser
 
-    def __init__(self, w: int = 0, h: int = 0, r: str = "", n: str = "", a: str = "", c: str = "", e: str = "", d: list = []):
+    def load(save_file: str):
+        """Loads and decodes a RLE file.
+
+        The file is streamed into the decoder line by line instead of being read into a string first.
+
+        :param str save_file: Path of the file to be loaded.
+        :return: The parser holding the decoded pattern.
+        :rtype: RLE
+        """
+        try:
+            with open(save_file, "r") as file:
+                return RLE.decode(file)
+        except (OSError, ValueError) as e:
+            print("Couldn't load file.", e)
+            return None
+
+    def __init__(self, w: int = 0, h: int = 0, r: str = "", n: str = "", a: str = "", c: str = "", e: str = "", d: numpy.ndarray = None):
         self.width = w
         self.height = h
         self.rule = r
@@ -98,7 +162,11 @@ class RLE:
         self.author = a
         self.comments = c
         self.encoded = e
-        self.decoded = d
+        self.decoded = numpy.zeros((h, w), dtype=numpy.uint8) if d is None else d
+        self.pattern_lines = []
+
+        # Line types are determined by their first character
+        self.line_handlers = {"#": self.decode_header, "x": self.decode_rule}
 
     def encode_header(self) -> None:
         """Converts data into header lines and writes them into self.encoded.
@@ -121,42 +189,39 @@ class RLE:
 
     def encode_pattern(self, array) -> None:
         """Converts the array into an encoded string and writes it into self.encoded.
+
+        The runs of all rows are found in one pass over the whole array
+        and turned into tokens with numpy string operations.
         """
-        result = ""
-        last_value = None
-        count = 0
-        for row in array:
-            for value in row:
-                # If the value is the same as the last value, increment the count
-                if value == last_value:
-                    count += 1
-                # If the value is different from the last value, append the count and value to the result string
-                # and reset the count and last_value variables
-                else:
-                    if count > 1:
-                        result += str(count)
-                    if last_value is not None:
-                        if last_value:
-                            result += "o"
-                        else:
-                            result += "b"
-                    count = 1
-                    last_value = value
-            # If the last value was a 1, append the final count and value to the result string
-            if last_value == 1:
-                if count > 1:
-                    result += str(count)
-                result += "o"
-            result += "$"
-            count = 0
-            last_value = None
-        # Remove the last $
+        grid = numpy.asarray(array, dtype=numpy.uint8)
+
+        # A run starts at the first cell of every row and wherever the value changes
+        first = numpy.ones(grid.shape, dtype=bool)
+        first[:, 1:] = grid[:, 1:] != grid[:, :-1]
+        starts = numpy.flatnonzero(first)
+        lengths = numpy.diff(numpy.append(starts, grid.size))
+        values = grid.ravel()[starts]
+        rows = starts // max(grid.shape[1], 1)
+
+        # Dead cells at the end of a row can be omitted
+        last = numpy.append(rows[1:] != rows[:-1], True)
+        keep = ~last | (values != 0)
+        lengths, values, rows = lengths[keep], values[keep], rows[keep]
+
+        # Every row ends with a $, so rows without any runs consist of just that
+        if len(rows) != 0:
+            row_ends = numpy.diff(numpy.append(rows, grid.shape[0]))
+            tokens = numpy.char.add(numpy.where(lengths > 1, lengths.astype(str), ""), numpy.where(values != 0, "o", "b"))
+            tokens = numpy.char.add(tokens, numpy.char.multiply("$", row_ends))
+            result = "$" * int(rows[0]) + "".join(tokens.tolist())
+        else:
+            result = "$" * grid.shape[0]
+
+        # Replace the last $ with the end of pattern marker
         result = result[:-1] + "!"
 
         # Line breaks after 70 chars
-        for x in range(len(result)):
-            if not x % 70 and x != 0:
-                result = result[:(x + int(x / 71))] + "\n" + result[(x + int(x / 71)):]
+        result = "\n".join(result[x:x + 70] for x in range(0, len(result), 70))
 
         self.encoded += "\n" + result
 
@@ -168,14 +233,13 @@ class RLE:
 
         # is a header
         x are the rules
-        Everything else should be the encoded pattern.
+        Everything else should be the encoded pattern and is collected in self.pattern_lines.
         """
-        if line.startswith("#"):
-            self.decode_header(line)
-        elif line.startswith("x"):
-            self.decode_rule(line)
+        handler = self.line_handlers.get(line[:1])
+        if handler is not None:
+            handler(line)
         else:
-            self.encoded += line
+            self.pattern_lines.append(line)
 
     def decode_header(self, line: str) -> None:
         """Converts the header lines into data.
@@ -185,12 +249,11 @@ class RLE:
         O: The author
         N: Name of the pattern
         """
-        if line[1:].startswith("C"):
+        field = line[1:2]
+        if field == "C":
             self.comments += line[2:] + "\n"
-        elif line[1:].startswith("O"):
-            self.author = line[2:]
-        elif line[1:].startswith("N"):
-            self.name = line[2:]
+        elif field in self.header_fields:
+            setattr(self, self.header_fields[field], line[2:])
         else:
             raise Exception("Unknown header.")
 
@@ -211,11 +274,9 @@ class RLE:
         self.height = int(y_parts[1].strip())
 
         # Third rule is not mandatory
-        try:
+        if len(parts) > 2 and "=" in parts[2]:
             r_parts = parts[2].split("=")
             self.rule = r_parts[1].strip()
-        except:
-            pass
 
         if self.rule != "B3/S23" and self.rule != "":
             raise Exception("Sorry, cant decode a pattern using rule " + self.rule)
@@ -228,36 +289,43 @@ class RLE:
         o = Alive cell
         $ = New row
         ! = End of string
-        Any number in front of b or o is a multiplier. (So 2b is [0, 0].)
+        Any number in front of b, o or $ is a multiplier. (So 2b is [0, 0].)
         Dead cells at the end of a row can be omitted.
+
+        The string is split into runs using a regular expression. The row and
+        column of every run are then derived with cumulative sums, so the
+        array is filled without looping over the runs in Python.
         """
-        result = []
-        row = []
-        multiplier = None
-
-        for char in self.encoded:
-            if char == 'b':
-                row.extend([0] * (1 if multiplier is None else multiplier))
-                multiplier = None
-            elif char == 'o':
-                row.extend([1] * (1 if multiplier is None else multiplier))
-                multiplier = None
-            elif char == '$':
-                row.extend([0] * (self.width - len(row)))
-                if len(row) > self.width:
-                    raise Exception("Line too long for pattern width.")
-                result.append(row)
-                row = []
-            elif char.isdigit():
-                if multiplier is not None:
-                    multiplier = int(str(multiplier) + char)
-                else:
-                    multiplier = int(char)
-            elif char == '!':
-                row.extend([0] * (self.width - len(row)))
-                if len(row) > self.width:
-                    raise Exception("Line too long for pattern width.")
-                result.append(row)
-                break
+        result = numpy.zeros(self.height * self.width, dtype=numpy.uint8)
+
+        # Everything after the end of string is ignored
+        runs = RLE_TOKEN.findall(self.encoded.partition('!')[0])
+
+        if len(runs) != 0:
+            runs = numpy.array(runs)
+            tags = runs[:, 1]
+            # Runs without a multiplier count once, the digits are converted by numpy in one cast
+            counts = numpy.where(runs[:, 0] == '', '1', runs[:, 0]).astype(numpy.int64)
+            new_rows = numpy.where(tags == '$', counts, 0)
+            cells = counts - new_rows
+
+            # Row of every run and the column it ends in, which is reset by every $
+            rows = numpy.cumsum(new_rows)
+            ends = numpy.cumsum(cells)
+            ends -= numpy.maximum.accumulate(numpy.where(tags == '$', ends, 0))
+
+            if ends.max() > self.width:
+                raise Exception("Line too long for pattern width.")
+
+            alive = tags == 'o'
+            if alive.any() and rows[alive].max() >= self.height:
+                raise Exception("Too many lines for pattern height.")
+
+            # Mark the first cell and the cell after every alive run, the cumulative sum fills the cells inbetween
+            starts = rows[alive] * self.width + ends[alive] - cells[alive]
+            edges = numpy.bincount(starts, minlength=result.size + 1) - numpy.bincount(starts + cells[alive], minlength=result.size + 1)
+            result = (numpy.cumsum(edges[:-1]) > 0).astype(numpy.uint8)
+
+        result = result.reshape(self.height, self.width)
 
         self.decoded = result
@@ -1,42 +1,21 @@
 import argparse
+import functools
+import pathlib
 import sys
 import os
 
 
+@functools.lru_cache(maxsize=None)
 def get_save_path(subfolder: str) -> str:
     """Makes sure the subfolder folder exists and return its path.
+    The path is cached, so the folder is only looked up and created once.
 
     :return: The home directory of the user appended with subfolder.
     :rtype: string
     """
-    path = os.path.expanduser("~") + subfolder
-    if not os.path.exists(path):
-        os.makedirs(path)
-    return path
-
-
-def save_export(content: str, save_file: str) -> bool:
-    """Saves string in file.
-    """
-    try:
-        with open(save_file, "w") as file:
-            file.write(content)
-        print("Successfully saved into:", save_file)
-        return True
-    except Exception as e:
-        print("Couldn't save file.", e)
-        return False
-
-
-def load_import(save_file) -> str:
-    """Load the contents of a file.
-    """
-    try:
-        with open(save_file, "r") as file:
-            return file.read()
-    except Exception as e:
-        print("Couldn't load file.", e)
-        return None
+    path = pathlib.Path.home() / subfolder.strip("/")
+    path.mkdir(parents=True, exist_ok=True)
+    return os.path.join(str(path), "")
 
 
 def shutdown(pygame) -> None:
@@ -58,143 +37,153 @@ def str2bool(value):
         raise argparse.ArgumentTypeError('Boolean value expected.')
 
 
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Creates the command line parser. It is only built once and reused afterwards.
+
+    :return: The parser for all CLI arguments.
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="CGOL",
+        description="Conway's Game of Life")
+    parser.add_argument(
+        "-rw",
+        dest="rw",
+        required=False,
+        default=1280,
+        type=int,
+        help="Width of the Game.")
+    parser.add_argument(
+        "-rh",
+        dest="rh",
+        required=False,
+        default=720,
+        type=int,
+        help="Height of the Game.")
+    parser.add_argument(
+        "-ca",
+        dest="ca",
+        required=False,
+        default=(255, 144, 0),
+        type=int,
+        help="Color for alive cells. 'R G B'",
+        nargs='+')
+    parser.add_argument(
+        "-cd",
+        dest="cd",
+        required=False,
+        default=(0, 0, 0),
+        type=int,
+        help="Color for dead cells. 'R G B'",
+        nargs='+')
+    parser.add_argument(
+        "-cf",
+        dest="cf",
+        required=False,
+        default=(0, 0, 0),
+        type=int,
+        help="Color to fade dead cells to. 'R G B'",
+        nargs='+')
+    parser.add_argument(
+        "-cb",
+        dest="cb",
+        required=False,
+        default=(16, 16, 16),
+        type=int,
+        help="Color for dead cells. 'R G B'",
+        nargs='+')
+    parser.add_argument(
+        "-cs",
+        dest="cs",
+        required=False,
+        default=8,
+        type=int,
+        help="Size of a cell in pixel.")
+    parser.add_argument(
+        "-gw",
+        dest="gw",
+        required=False,
+        default=160,
+        type=int,
+        help="Width of the World.")
+    parser.add_argument(
+        "-gh",
+        dest="gh",
+        required=False,
+        default=90,
+        type=int,
+        help="Height of the World.")
+    parser.add_argument(
+        "-ti",
+        dest="ti",
+        required=False,
+        default=60,
+        type=float,
+        help="Number of times the game shall update in a second (FPS).")
+    parser.add_argument(
+        "-se",
+        dest="se",
+        required=False,
+        default=-1,
+        type=int,
+        help="Seed value used to create World.")
+    parser.add_argument(
+        "-ps",
+        dest="ps",
+        required=False,
+        default=False,
+        type=str2bool,
+        nargs='?',
+        const=True,
+        help="Game pauses on a stalemate.")
+    parser.add_argument(
+        "-po",
+        dest="po",
+        required=False,
+        default=False,
+        type=str2bool,
+        nargs='?',
+        const=True,
+        help="Game pauses when only oscillators remain.")
+    parser.add_argument(
+        "-fr",
+        dest="fr",
+        required=False,
+        default=0.01,
+        type=float,
+        help="Value by which a cell should decrease every generation.")
+    parser.add_argument(
+        "-fd",
+        dest="fd",
+        required=False,
+        default=0.5,
+        type=float,
+        help="Value a cell should have after death.")
+    parser.add_argument(
+        "-to",
+        dest="to",
+        required=False,
+        default=True,
+        type=str2bool,
+        nargs='?',
+        const=True,
+        help="Enables toroidal space (Cells wrap around edges).")
+    parser.add_argument(
+        "-fa",
+        dest="fa",
+        required=False,
+        default=True,
+        type=str2bool,
+        nargs='?',
+        const=True,
+        help="Enables fade effect.")
+    return parser
+
+
 def parse_cli() -> argparse.Namespace:
     try:
-        parser = argparse.ArgumentParser(
-            prog="CGOL",
-            description="Conway's Game of Life")
-        parser.add_argument(
-            "-rw",
-            dest="rw",
-            required=False,
-            default=1280,
-            type=int,
-            help="Width of the Game.")
-        parser.add_argument(
-            "-rh",
-            dest="rh",
-            required=False,
-            default=720,
-            type=int,
-            help="Height of the Game.")
-        parser.add_argument(
-            "-ca",
-            dest="ca",
-            required=False,
-            default=(255, 144, 0),
-            type=int,
-            help="Color for alive cells. 'R G B'",
-            nargs='+')
-        parser.add_argument(
-            "-cd",
-            dest="cd",
-            required=False,
-            default=(0, 0, 0),
-            type=int,
-            help="Color for dead cells. 'R G B'",
-            nargs='+')
-        parser.add_argument(
-            "-cf",
-            dest="cf",
-            required=False,
-            default=(0, 0, 0),
-            type=int,
-            help="Color to fade dead cells to. 'R G B'",
-            nargs='+')
-        parser.add_argument(
-            "-cb",
-            dest="cb",
-            required=False,
-            default=(16, 16, 16),
-            type=int,
-            help="Color for dead cells. 'R G B'",
-            nargs='+')
-        parser.add_argument(
-            "-cs",
-            dest="cs",
-            required=False,
-            default=8,
-            type=int,
-            help="Size of a cell in pixel.")
-        parser.add_argument(
-            "-gw",
-            dest="gw",
-            required=False,
-            default=160,
-            type=int,
-            help="Width of the World.")
-        parser.add_argument(
-            "-gh",
-            dest="gh",
-            required=False,
-            default=90,
-            type=int,
-            help="Height of the World.")
-        parser.add_argument(
-            "-ti",
-            dest="ti",
-            required=False,
-            default=60,
-            type=float,
-            help="Number of times the game shall update in a second (FPS).")
-        parser.add_argument(
-            "-se",
-            dest="se",
-            required=False,
-            default=-1,
-            type=int,
-            help="Seed value used to create World.")
-        parser.add_argument(
-            "-ps",
-            dest="ps",
-            required=False,
-            default=False,
-            type=str2bool,
-            nargs='?',
-            const=True,
-            help="Game pauses on a stalemate.")
-        parser.add_argument(
-            "-po",
-            dest="po",
-            required=False,
-            default=False,
-            type=str2bool,
-            nargs='?',
-            const=True,
-            help="Game pauses when only oscillators remain.")
-        parser.add_argument(
-            "-fr",
-            dest="fr",
-            required=False,
-            default=0.01,
-            type=float,
-            help="Value by which a cell should decrease every generation.")
-        parser.add_argument(
-            "-fd",
-            dest="fd",
-            required=False,
-            default=0.5,
-            type=float,
-            help="Value a cell should have after death.")
-        parser.add_argument(
-            "-to",
-            dest="to",
-            required=False,
-            default=True,
-            type=str2bool,
-            nargs='?',
-            const=True,
-            help="Enables toroidal space (Cells wrap around edges).")
-        parser.add_argument(
-            "-fa",
-            dest="fa",
-            required=False,
-            default=True,
-            type=str2bool,
-            nargs='?',
-            const=True,
-            help="Enables fade effect.")
-        args = parser.parse_args()
+        args = build_parser().parse_args()
         return args
     except argparse.ArgumentError as err:
         sys.exit(2)
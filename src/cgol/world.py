@@ -2,9 +2,165 @@
 World
 ====
 """
+import functools
 import numpy
 
 
+# Constants for shifting 64 bit words, so that numpy does not promote the results to floats
+ONE = numpy.uint64(1)
+SIXTY_THREE = numpy.uint64(63)
+
+
+def pack_bits(cells: numpy.ndarray) -> numpy.ndarray:
+    """Packs a 2D boolean or 0/1 array into 64 bit words along the second axis.
+    Cell (x, y) is stored in bit y % 64 of word y // 64 of row x.
+    The unused bits of the last word in every row are 0.
+
+    :param numpy.array cells: The 2D boolean or 0/1 array.
+    :return: The packed array in the shape (width, ceil(height / 64)).
+    :rtype: numpy.array uint64
+    """
+    width, height = cells.shape
+    packed = numpy.zeros((width, -(-height // 64) * 8), dtype=numpy.uint8)
+    packed[:, :-(-height // 8)] = numpy.packbits(cells, axis=1, bitorder="little")
+    return packed.view("<u8")
+
+
+def unpack_bits(packed: numpy.ndarray, height: int) -> numpy.ndarray:
+    """Unpacks 64 bit words created by pack_bits into a 2D boolean array.
+
+    :param numpy.array packed: The packed array.
+    :param int height: The number of cells per row.
+    :return: The 2D boolean array.
+    :rtype: numpy.array bool
+    """
+    cells = numpy.unpackbits(packed.astype("<u8", copy=False).view(numpy.uint8), axis=1, count=height, bitorder="little")
+    return cells.view(bool)
+
+
+@functools.lru_cache(maxsize=None)
+def last_cell(height: int) -> tuple:
+    """Gets the position of the last cell of a packed row, computed once per grid height.
+
+    :param int height: The number of cells per row.
+    :return: The index of the last word, the last bit as 64 bit shift and a mask clearing that bit.
+    :rtype: tuple
+    """
+    last_word, last_bit = (height - 1) // 64, numpy.uint64((height - 1) % 64)
+    return last_word, last_bit, ~(ONE << last_bit)
+
+
+def north_neighbors(packed: numpy.ndarray, height: int, toroid: bool) -> numpy.ndarray:
+    """Moves every cell one step along the second axis, so that each bit holds its neighbor at y - 1.
+    The lowest bit of a word gets the highest bit of the previous word.
+
+    :param numpy.array packed: The packed array.
+    :param int height: The number of cells per row.
+    :param bool toroid: Whether the first cell gets the last cell of the row or a dead cell.
+    :return: The shifted packed array.
+    :rtype: numpy.array uint64
+    """
+    carry = numpy.roll(packed, 1, axis=1) >> SIXTY_THREE
+
+    # If the rows fill whole words, the roll already wraps the last cell around
+    if not toroid:
+        carry[:, 0] = 0
+    elif height % 64:
+        last_word, last_bit, _ = last_cell(height)
+        carry[:, 0] = (packed[:, last_word] >> last_bit) & ONE
+    return (packed << ONE) | carry
+
+
+def south_neighbors(packed: numpy.ndarray, height: int, toroid: bool) -> numpy.ndarray:
+    """Moves every cell one step back along the second axis, so that each bit holds its neighbor at y + 1.
+    The highest bit of a word gets the lowest bit of the next word.
+
+    :param numpy.array packed: The packed array.
+    :param int height: The number of cells per row.
+    :param bool toroid: Whether the last cell gets the first cell of the row or a dead cell.
+    :return: The shifted packed array.
+    :rtype: numpy.array uint64
+    """
+    shifted = (packed >> ONE) | (numpy.roll(packed, -1, axis=1) << SIXTY_THREE)
+
+    # If the rows fill whole words, the roll already wraps the first cell around
+    if toroid and height % 64 == 0:
+        return shifted
+
+    # The last cell of the row has to be set explicitly, because it may lie inside of a word
+    last_word, last_bit, mask = last_cell(height)
+    shifted[:, last_word] &= mask
+    if toroid:
+        shifted[:, last_word] |= (packed[:, 0] & ONE) << last_bit
+    return shifted
+
+
+def full_adder(a: numpy.ndarray, b: numpy.ndarray, c: numpy.ndarray) -> tuple:
+    """Adds three bit planes.
+
+    :return: The sum bit and the carry bit.
+    :rtype: tuple
+    """
+    half = a ^ b
+    return half ^ c, (a & b) | (half & c)
+
+
+def count_neighbors(padded: numpy.ndarray, height: int, toroid: bool) -> tuple:
+    """Counts the alive neighbors of 64 cells at once using bitwise adders (SWAR).
+    The packed rows have to be padded with one row on both sides, holding
+    either dead cells or the rows from the opposite border.
+
+    The 3x3 neighborhood is summed in two steps, like a separable filter:
+    1. The north and south neighbors are shifted out of the packed words once.
+       Together with the cell itself they are added into a 2 bit column sum.
+    2. The column sums of the west and east rows are slices of the padded column sums,
+       the center column only adds north and south.
+
+    The three 2 bit sums are added into the bit planes of the count:
+        s0: Bit 0 of the count.
+        s1: Bit 1 of the count.
+        s2: The count is 4 or higher.
+
+    :param numpy.array padded: The packed alive cells with a padding row on both sides.
+    :param int height: The number of cells per row.
+    :param bool toroid: Whether the neighbors wrap around the borders.
+    :return: The bit planes s0, s1 and s2 without the padding rows.
+    :rtype: tuple
+    """
+    north = north_neighbors(padded, height, toroid)
+    south = south_neighbors(padded, height, toroid)
+
+    # Sum of every column of three cells, shared by the rows to the west and east
+    column = full_adder(north, padded, south)
+    west = [plane[:-2] for plane in column]
+    east = [plane[2:] for plane in column]
+
+    # The center column doesn't count the cell itself
+    middle = (north[1:-1] ^ south[1:-1], north[1:-1] & south[1:-1])
+
+    # Add the three 2 bit numbers
+    s0, carry = full_adder(west[0], middle[0], east[0])
+    twos, fours = full_adder(west[1], middle[1], east[1])
+    return s0, twos ^ carry, fours | (twos & carry)
+
+
+def grids_equal(a: numpy.ndarray, b: numpy.ndarray) -> bool:
+    """Compares two grids by their raw bytes, 8 bytes at a time like memcmp.
+    Comparing 64 bit words is a single reduction over 8 times fewer elements than comparing cells.
+
+    :param numpy.array a: The first grid.
+    :param numpy.array b: The second grid.
+    :return: Are the grids the same?
+    :rtype: bool
+    """
+    if a.shape != b.shape or a.dtype != b.dtype:
+        return False
+    # Only contiguous grids can be viewed as words, the grid is a strided view after reduce()
+    if a.nbytes % 8 or not a.flags.c_contiguous or not b.flags.c_contiguous:
+        return not (a != b).any()
+    return not (a.reshape(-1).view(numpy.uint64) != b.reshape(-1).view(numpy.uint64)).any()
+
+
 class World:
     """World
     ====
@@ -27,10 +183,15 @@ class World:
         self.seed = numpy.random.randint(2**16 - 1) if se == -1 else se
         self.generations = 0
 
+        # Fading cells need floats, change_rules_func switches to uint8 without the fade
+        self.dtype = numpy.float32
+
         # If 'rows' are empty, create new grid, else convert 'rows' to numpy array
-        self.populate("seed") if len(rows) == 0 else self.load_from_csv(rows)
+        self.populate("seed") if len(rows) == 0 else self.load_list(rows)
         self.grid_backup_0 = numpy.zeros_like(self.grid)
         self.grid_backup_1 = numpy.zeros_like(self.grid)
+        self.padded = numpy.zeros((0, 0), dtype=numpy.uint64)
+        self.spare = numpy.zeros((0, 0), dtype=self.dtype)
 
     def populate(self, mode: str) -> None:
         """Fill 'grid' with different values.
@@ -38,31 +199,50 @@ class World:
         :param bool mode: The mode based on which the array should be filled.
         """
         if mode == "seed":
-            self.grid = numpy.random.default_rng(self.seed).choice([0.0, 1.0], size=(self.grid_width, self.grid_height), p=[0.75, 0.25])
+            self.grid = self.random_cells(numpy.random.default_rng(self.seed))
         if mode == "random":
-            self.grid = numpy.random.choice([0.0, 1.0], size=(self.grid_width, self.grid_height), p=[0.75, 0.25])
+            self.grid = self.random_cells(numpy.random.default_rng())
         elif mode == "alive":
-            self.grid = numpy.ones((self.grid_width, self.grid_height), dtype=float)
+            self.grid = numpy.ones((self.grid_width, self.grid_height), dtype=self.dtype)
         elif mode == "dead":
-            self.grid = numpy.zeros((self.grid_width, self.grid_height), dtype=float)
+            self.grid = numpy.zeros((self.grid_width, self.grid_height), dtype=self.dtype)
         elif mode == "kill":
             self.grid[self.grid == 1.0] = self.fade_dead
         else:
             return False
 
+    def random_cells(self, rng) -> numpy.array:
+        """Creates a grid in which a quarter of the cells are alive.
+        Every cell gets one random byte, which is alive if it is below 64. Drawing the bytes
+        in one call is faster than drawing floats or using choice() with probabilities.
+
+        :param numpy.random.Generator rng: The generator to draw the bytes from.
+        :return: The new grid.
+        :rtype: numpy.array
+        """
+        cells = numpy.frombuffer(rng.bytes(self.grid_width * self.grid_height), dtype=numpy.uint8)
+        return (cells.reshape(self.grid_width, self.grid_height) < 64).astype(self.dtype)
+
     def load_list(self, grid) -> None:
-        """Loads data a list
+        """Loads data a list or an array, like the uint8 arrays returned by CSV.load and RLE.decode.
+        The data is always copied, because the grid is reused as a buffer by later generations.
 
         :param list grid: The 2D List filled with 0s and 1s.
         """
-        self.grid = numpy.array(grid, dtype=float)
+        self.grid = numpy.array(grid, dtype=self.dtype)
+        self.grid_width, self.grid_height = self.grid.shape
 
     def backup(self) -> None:
         """Creates a shallow copy of the grid.
+        The backups are rotated, so that the grid only has to be copied into the oldest one.
         """
-        temp = numpy.copy(self.grid_backup_0)
-        self.grid_backup_0 = numpy.copy(self.grid)
-        self.grid_backup_1 = numpy.copy(temp)
+        self.grid_backup_0, self.grid_backup_1 = self.grid_backup_1, self.grid_backup_0
+
+        # The grid may have been resized since the last backup
+        if self.grid_backup_0.shape == self.grid.shape:
+            numpy.copyto(self.grid_backup_0, self.grid)
+        else:
+            self.grid_backup_0 = numpy.copy(self.grid)
 
     def insert_pattern(self, pattern, pos, rotation=0) -> None:
         if not isinstance(pattern, numpy.ndarray) or pattern.ndim < 2:
@@ -80,7 +260,7 @@ class World:
         :return: Is the backup the same as the current grid?
         :rtype: bool
         """
-        return numpy.array_equal(self.grid, self.grid_backup_0)
+        return grids_equal(self.grid, self.grid_backup_0)
 
     def check_oscillators(self) -> bool:
         """Compares the second last backup with the current grid to see of it changed.
@@ -88,7 +268,7 @@ class World:
         :return: Is the second last backup the same as the current grid?
         :rtype: bool
         """
-        return numpy.array_equal(self.grid, self.grid_backup_1)
+        return grids_equal(self.grid, self.grid_backup_1)
 
     def extend(self) -> None:
         """Extends grid in every direction by one row/column.
@@ -101,7 +281,7 @@ class World:
         """Reduce the size of the grid by removing the outermost row and column on all sides.
         If the grid has a width or height less than 3, the function returns without modifying the grid.
         """
-        if len(self.grid) < 3 or len(self.grid[0]) < 3:
+        if self.grid.shape[0] < 3 or self.grid.shape[1] < 3:
             return
         self.grid = self.grid[1:-1, 1:-1]
         self.grid_width -= 2
@@ -116,129 +296,126 @@ class World:
     def change_rules_func(self, fade: bool):
         if fade:
             self.apply_rules = self.apply_rules_fade
+            self.dtype = numpy.float32
         else:
             self.apply_rules = self.apply_rules_normal
+            self.dtype = numpy.uint8
 
-    def get_neighbors_normal(self) -> numpy.array:
-        """Gets the number of alive neighbors of a cell in normal space.
-        It uses the numpy roll function to shift the values in the
-        grid along the x and y axis, but pads the grid by one in every
-        directio, to avoid wrapping around borders.
-        The resulting shifted arrays are summed and returned as the
-        number of neighbors for each cell.
-
-        The faded values are clipped so that they become integers.
-
-        self.grid:          clipped_grid:   padded_grid:
-                                                [[0 0 0 0 0]
-            [[1. 0.2 1. ]       [[1 0 1]         [0 1 0 1 0]
-             [0. 1.  0.4]   ->   [0 1 0]   ->    [0 0 1 0 0]
-             [1. 0.  1. ]]       [1 0 1]]        [0 1 0 1 0]
-                                                 [0 0 0 0 0]]
-
-        Afterwards the grid is rolled and the values, minus the
-        borders, are added onto 'neighbors'.
-
-        :return: An array with the count of alive neighbors for each cell.
-        :rtype: numpy.array int
-        """
-        # Create a new array the same size as 'grid'
-        neighbors = numpy.zeros_like(self.grid, dtype=int)
+        # Without fading cells only 0s and 1s are stored, so a byte per cell is enough
+        self.grid = self.grid.astype(self.dtype)
+        self.grid_backup_0 = self.grid_backup_0.astype(self.dtype)
+        self.grid_backup_1 = self.grid_backup_1.astype(self.dtype)
 
-        # Convert faded values to zeros
-        clipped_grid = numpy.where(self.grid < 1, 0, 1)
+    def pack_padded(self) -> numpy.array:
+        """Packs the alive cells into the buffer 'padded', which has an extra row on both sides.
+        The buffer is kept between generations and only allocated again when the grid was resized.
 
-        # Add padding to the grid using numpy.pad
-        padded_grid = numpy.pad(clipped_grid, pad_width=1, mode='constant', constant_values=0)
+        :return: The padded buffer, 'packed' is a view of its inner rows.
+        :rtype: numpy.array uint64
+        """
+        shape = (self.grid.shape[0] + 2, -(-self.grid.shape[1] // 64))
+        if self.padded.shape != shape:
+            self.padded = numpy.zeros(shape, dtype=numpy.uint64)
+            self.packed = self.padded[1:-1]
 
-        # Roll over every axis to get a new array with the number of neighbors
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                # Don't roll if both directions are 0.
-                if not dx and not dy:
-                    continue
-                neighbors += numpy.roll(numpy.roll(padded_grid, dx, axis=0), dy, axis=1)[1:-1, 1:-1]
+        # Without fading the grid only holds 0s and 1s and is packed as it is, else faded values count as dead
+        self.packed[:] = pack_bits(self.grid if self.grid.dtype == numpy.uint8 else self.grid >= 1)
+        return self.padded
 
-        return neighbors
+    def get_neighbors_normal(self) -> tuple:
+        """Gets the number of alive neighbors of a cell in normal space.
+        The alive cells are packed into 64 bit words with pack_padded, so
+        that every word holds 64 cells of a row. Faded values count as dead.
+        The padding row on both sides of the packed buffer stays all zeros,
+        so the cells at the borders only see dead cells beyond them.
+        The neighbors of 64 cells are then counted at once using count_neighbors.
+
+        self.grid:          padded:
+                                [[0 0 0]    <- padding row
+            [[1. 0.2 1. ]        [1 0 1]
+             [0. 1.  0.4]   ->   [0 1 0]
+             [1. 0.  1. ]]       [1 0 1]
+                                 [0 0 0]]   <- padding row
 
-    def get_neighbors_toroidal(self) -> numpy.array:
-        """Gets the number of alive neighbors of a cell in a toroidal space.
-        It uses the numpy roll function to shift the values in the
-        grid along the x and y axis.
-        The resulting shifted arrays are summed and returned as the
-        number of neighbors for each cell.
+        :return: The bit planes of the count of alive neighbors for each cell.
+        :rtype: tuple
+        """
+        padded = self.pack_padded()
 
-        The faded values are clipped so that they become integers.
+        # The padding rows stay dead
+        return count_neighbors(padded, self.grid.shape[1], False)
 
-        self.grid:          clipped_grid:
-            [[1. 0.2 1. ]       [[1 0 1]
+    def get_neighbors_toroidal(self) -> tuple:
+        """Gets the number of alive neighbors of a cell in a toroidal space.
+        The alive cells are packed into 64 bit words with pack_padded, so
+        that every word holds 64 cells of a row. Faded values count as dead.
+        The padding row on both sides of the packed buffer is a copy of the
+        row at the opposite border, and the bit shifts within the rows wrap
+        around as well. The neighbors of 64 cells are then counted at once
+        using count_neighbors.
+
+        self.grid:          padded:
+                                [[1 0 1]    <- copy of the last row
+            [[1. 0.2 0. ]        [1 0 0]
              [0. 1.  0.4]   ->   [0 1 0]
-             [1. 0.  1. ]]       [1 0 1]]
+             [1. 0.  1. ]]       [1 0 1]
+                                 [1 0 0]]   <- copy of the first row
 
-        Afterwards the grid is rolled and added onto 'neighbors'.
+        :return: The bit planes of the count of alive neighbors for each cell.
+        :rtype: tuple
+        """
+        padded = self.pack_padded()
 
-        neighbors after the rolls:
-        1.  [[1 0 0] -> 2.  [[1 0 0] -> 3.  [[1 1 1] ->
-             [0 1 1]         [1 1 2]         [2 2 2]
-             [0 1 1]]        [1 1 2]]        [2 2 2]]
+        # The padding rows are the rows from the opposite border
+        padded[0] = padded[-2]
+        padded[-1] = padded[1]
 
-        4.  [[1 2 2] ->                 5.  [[2 3 2] ->
-             [3 2 2]          skip           [3 2 3]
-             [2 3 3]]                        [3 4 3]]
+        return count_neighbors(padded, self.grid.shape[1], True)
 
-        6.  [[2 4 3] -> 7.  [[3 4 4] -> 8.  [[4 5 4]
-             [3 3 4]         [4 3 5]         [5 4 5]
-             [4 4 3]]        [4 5 3]]        [4 5 4]]
+    def get_next_alive(self, neighbors) -> numpy.array:
+        """Evaluates the B3/S23 rules on the bit planes of the neighbor count for 64 cells at once.
 
-        :return: An array with the count of alive neighbors for each cell.
-        :rtype: numpy.array int
-        """
-        # Create a new array the same size as 'grid'
-        neighbors = numpy.zeros_like(self.grid, dtype=int)
+        A count of 2 or 3 has s1 set and s2 unset, a count of exactly 3 additionally has s0 set.
+        So a cell is alive in the next generation if s1 and not s2 and either s0 or the cell is alive,
+        which is evaluated on the packed words before a single unpack.
 
-        # Convert faded values to zeros
-        clipped_grid = numpy.where(self.grid < 1, 0, 1)
+        :param tuple neighbors: The bit planes of the number of neighbors for each cell.
+        :return: Cells that are alive in the next generation.
+        :rtype: numpy.array bool
+        """
+        s0, s1, s2 = neighbors
+        return unpack_bits(s1 & ~s2 & (s0 | self.packed), self.grid.shape[1])
 
-        # Roll over every axis to get a new array with the number of neighbors
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                # Dont roll if both directions are 0.
-                if not dx and not dy:
-                    continue
-                neighbors += numpy.roll(numpy.roll(clipped_grid, dx, axis=0), dy, axis=1)
+    def get_spare(self) -> numpy.array:
+        """Gets the grid of the previous generation to store the next generation in,
+        so that no new grid has to be allocated every generation.
 
-        return neighbors
+        :return: The spare grid in the shape and type of 'grid'.
+        :rtype: numpy.array
+        """
+        if self.spare.shape != self.grid.shape or self.spare.dtype != self.grid.dtype:
+            self.spare = numpy.empty_like(self.grid)
+        return self.spare
 
     def apply_rules_normal(self, neighbors) -> numpy.array:
-        """Determines the new state of each cell for the current tick using numpy.where()
-            to avaid nested for loops.
+        """Determines the new state of each cell for the current tick from the packed
+            next generation, to avaid nested for loops.
 
             The standard rules of Conway's Game of Life apply. (B3/S23)
 
-            :param numpy.array neighbors: The number of neighbors for each cell.
+            :param tuple neighbors: The bit planes of the number of neighbors for each cell.
             :return: New state of cells.
-            :rtype: numpy.array int
+            :rtype: numpy.array uint8
             """
-        # Create a copy of the grid to store the next generation
-        next_generation = numpy.copy(self.grid)
-
-        # Find the indices of cells that are currently alive
-        alive = numpy.where(self.grid == 1)
-
-        # Find the indices of cells that are currently dead
-        dead = numpy.where(self.grid == 0)
-
-        # Apply the rules to cells that are currently alive
-        next_generation[alive] = numpy.where((neighbors[alive] == 2) | (neighbors[alive] == 3), 1, 0)
-
-        # Apply the rule to cells that are currently dead
-        next_generation[dead] = numpy.where(neighbors[dead] == 3, 1, 0)
+        # Cells with 2 or 3 neighbors survive, cells with 3 neighbors are born
+        next_generation = self.get_spare()
+        numpy.copyto(next_generation, self.get_next_alive(neighbors))
 
         return next_generation
 
     def apply_rules_fade(self, neighbors) -> numpy.array:
         """Determines the new state of each cell for the current tick using the "fade" implementation
-        and numpy.where() to avaid nested for loops.
+        and boolean masks to avaid nested for loops.
         In this implementation, cell values are stored as floats:
             1.0 = alive
             < 1.0 || > 0.0 = fading
@@ -254,26 +431,37 @@ class World:
             If the number of neighbors is 3, the cell becomes alive (value = 1.0).
             Otherwise, the cell's value is decreased by the "fade_rate" value.
 
-        :param numpy.array neighbors: The number of neighbors for each cell.
+        :param tuple neighbors: The bit planes of the number of neighbors for each cell.
         :return: New state of cells.
         :rtype: numpy.array float
         """
-        # Create a copy of the grid to store the next generation
-        next_generation = numpy.copy(self.grid)
+        # Cells with 2 or 3 neighbors survive, cells with 3 neighbors are born
+        next_alive = self.get_next_alive(neighbors)
+
+        next_generation = self.get_spare()
 
-        # Find the indices of cells that are currently alive
-        alive = numpy.where(self.grid == 1)
+        # The alive cells are kept apart from the fade values as boolean planes,
+        # so the planes can be blended arithmetically instead of writing through masks
+        dead = numpy.less(self.grid, 1)
+        dead_next = numpy.logical_not(next_alive)
 
-        # Find the indices of cells that are currently dead
-        dead = numpy.where(self.grid < 1)
+        # Cells that are currently dead fade out further, cells that faded out completely are dead
+        numpy.subtract(self.grid, self.fade_rate, out=next_generation)
+        numpy.maximum(next_generation, 0.0, out=next_generation)
+        fading = numpy.greater_equal(next_generation, 0.00001)
+        numpy.logical_and(fading, dead, out=fading)
+        numpy.logical_and(fading, dead_next, out=fading)
+        numpy.multiply(next_generation, fading, out=next_generation)
 
-        # Apply the rules to cells that are currently alive
-        next_generation[alive] = numpy.where((neighbors[alive] == 2) | (neighbors[alive] == 3), 1.0, self.fade_dead)
+        # Cells that are currently alive and die start fading
+        dying = numpy.logical_not(dead, out=dead)
+        numpy.logical_and(dying, dead_next, out=dying)
+        numpy.add(next_generation, numpy.multiply(dying, self.fade_dead, dtype=self.grid.dtype), out=next_generation)
 
-        # Apply the rule to cells that are currently dead
-        next_generation[dead] = numpy.where(neighbors[dead] == 3, 1.0, self.grid[dead] - self.fade_rate)
+        # Cells that are alive in the next generation
+        numpy.add(next_generation, next_alive, out=next_generation)
 
-        return numpy.where(next_generation < 0.00001, 0.0, next_generation)
+        return next_generation
 
     def update(self) -> None:
         """Updates the state of the cells in the world according to the rules of the Game of Life.
@@ -281,5 +469,5 @@ class World:
         # Get neighbors
         neighbors = self.get_neighbors()
 
-        # Apply rules
-        self.grid = self.apply_rules(neighbors)
+        # Apply rules, keep the current grid to store the generation after the next one
+        self.grid, self.spare = self.apply_rules(neighbors), self.grid